@@ -1,57 +1,207 @@
 import chess
+import chess.polyglot
 import json
-from typing import Union, List, Tuple, Literal
-from math import inf
-from copy import deepcopy
+import warnings
+from array import array
+from collections import OrderedDict
+from typing import Dict, Iterator, Union, List, Tuple, Literal
 
 
 class ChessGame:
+    # Number of positions whose sorted legal moves are kept
+    LEGAL_MOVES_CACHE_SIZE = 10000
+    # Number of positions whose end of game state is kept
+    FINISHED_CACHE_SIZE = 10000
+    # Pieces' values for the captures ordering, indexed by piece type. The king
+    # is the least valuable aggressor, as its captures are never recaptured
+    CAPTURE_PIECE_VALUES = (0, 1, 3, 3, 5, 9, 0)
+    # Polyglot's random numbers, so the hashes are the opening books' keys
+    ZOBRIST_ARRAY = chess.polyglot.POLYGLOT_RANDOM_ARRAY
+    ZOBRIST_HASHER = chess.polyglot.ZobristHasher(chess.polyglot.POLYGLOT_RANDOM_ARRAY)
+
+    __slots__ = ("board", "_legal_moves_cache", "_finished_cache", "_hash_stack")
+
     def __init__(self, board: chess.Board = None) -> None:
         self.board: chess.Board = None
         if board is None:
             self.board = chess.Board()
         else:
             self.board = board
-        self.hash = self.hash_game()
+        self._legal_moves_cache = OrderedDict()  # OrderedDict[int, List[chess.Move]]
+        self._finished_cache = OrderedDict()  # OrderedDict[int, bool]
+        # Hashes of the positions played, the current one on top
+        self._hash_stack = [self.hash_game()]
 
     def legal_moves(self) -> List[chess.Move]:
         """
         Returns a list containing all the legal
         moves for the current board state.
+
+        The list is a copy of the one cached for the position
+        by `_legal_moves_sorted`, so it's only generated once.
         """
-        legal_moves = list(self.board.legal_moves)
-        return legal_moves
+        return list(self._legal_moves_sorted())
 
     def _legal_moves_sorted(self) -> List[chess.Move]:
         """
         Returns a list containing all the legal moves for
         the current board state. These moves are ordered by
         a score which prioritizes captures and checks.
+
+        The sorted lists of the most recently used positions are
+        cached, so they aren't generated again when a position is
+        reached by another move order or by a deeper search.
         """
-        legal_moves = list(self.board.legal_moves)
-        legal_moves = sorted(legal_moves, key=lambda m: self._generate_move_score(m))
+        game_hash = self.hash
+        legal_moves = self._legal_moves_cache.get(game_hash, None)
+        if legal_moves is not None:
+            self._legal_moves_cache.move_to_end(game_hash)
+            return legal_moves
+        legal_moves = list(self.board.generate_legal_moves())
+        scores = self._generate_move_scores(legal_moves)
+        legal_moves = [legal_moves[i] for i in sorted(range(len(legal_moves)), key=scores.__getitem__)]
+        self._legal_moves_cache[game_hash] = legal_moves
+        if len(self._legal_moves_cache) > ChessGame.LEGAL_MOVES_CACHE_SIZE:
+            self._legal_moves_cache.popitem(last=False)
         return legal_moves
 
-    def _generate_move_score(self, move: chess.Move) -> int:
+    def _legal_captures_sorted(self) -> List[chess.Move]:
         """
-        Generate a score to prioritize moves in which
-        a piece is captured or a check happens.
+        Returns a list containing the legal captures for the
+        current board state, ordered by MVV-LVA (not cached).
         """
-        score = 0
-        if self.board.is_capture(move):
-            score += 1
-        # self.play(move)
-        # if self.board.is_check():
-        #     score += 1
-        # self.pop_play()
-        return -score
+        return sorted(self.board.generate_legal_captures(), key=self._capture_score, reverse=True)
+
+    def _capture_score(self, move: chess.Move) -> int:
+        """
+        Scores a capture by MVV-LVA (Most Valuable Victim -
+        Least Valuable Aggressor), without playing the move.
+        """
+        board = self.board
+        # En passant captures have no piece on the target square
+        victim = board.piece_type_at(move.to_square) or chess.PAWN
+        aggressor = board.piece_type_at(move.from_square)
+        piece_values = ChessGame.CAPTURE_PIECE_VALUES
+        return 10 * piece_values[victim] - piece_values[aggressor]
+
+    def _generate_move_scores(self, moves: List[chess.Move]) -> List[int]:
+        """
+        Generate the scores (lowest first) to prioritize moves in
+        which a piece is captured or a check happens. Captures
+        are ranked by MVV-LVA (Most Valuable Victim - Least
+        Valuable Aggressor), without playing the move.
+
+        The squares from which each piece type checks the enemy king,
+        and the pieces that may uncover a check, are found once for the
+        position. Only the moves of these pieces, promotions, castling
+        and en passant are left to '_gives_check'.
+        """
+        board = self.board
+        color = board.turn
+        occupied = board.occupied
+        enemy = board.occupied_co[not color]
+        ep_square = board.ep_square
+        bb_squares = chess.BB_SQUARES
+        king = board.king(not color)
+        if king is None:
+            check_squares = (0,) * 7
+            discoverers = 0
+        else:
+            diagonals = chess.BB_DIAG_ATTACKS[king][chess.BB_DIAG_MASKS[king] & occupied]
+            lines = chess.BB_RANK_ATTACKS[king][chess.BB_RANK_MASKS[king] & occupied]
+            lines |= chess.BB_FILE_ATTACKS[king][chess.BB_FILE_MASKS[king] & occupied]
+            # Indexed by piece type, as the checks are symmetric
+            check_squares = (
+                0,
+                chess.BB_PAWN_ATTACKS[not color][king],
+                chess.BB_KNIGHT_ATTACKS[king],
+                diagonals,
+                lines,
+                diagonals | lines,
+                0,
+            )
+            # Own pieces alone between the king and an own slider
+            own = board.occupied_co[color]
+            snipers = (chess.BB_RANK_ATTACKS[king][0] | chess.BB_FILE_ATTACKS[king][0]) & (board.rooks | board.queens)
+            snipers |= chess.BB_DIAG_ATTACKS[king][0] & (board.bishops | board.queens)
+            discoverers = 0
+            for sniper in chess.scan_reversed(snipers & own):
+                blockers = chess.between(king, sniper) & occupied
+                if blockers and not blockers & (blockers - 1):
+                    discoverers |= blockers
+            discoverers &= own
+        any_check_square = check_squares[5] | check_squares[1] | check_squares[2]
+        scores = []
+        for move in moves:
+            score = 0
+            to_square = move.to_square
+            to_mask = bb_squares[to_square]
+            if to_mask & enemy or (to_square == ep_square and board.is_capture(move)):
+                # Captures always come before the other moves
+                score += 100 + self._capture_score(move)
+            from_square = move.from_square
+            if move.promotion or to_square == ep_square or bb_squares[from_square] & (discoverers | board.kings):
+                gives_check = self._gives_check(move)
+            elif to_mask & any_check_square:
+                gives_check = to_mask & check_squares[board.piece_type_at(from_square)]
+            else:
+                gives_check = False
+            if gives_check:
+                score += 1
+            scores.append(-score)
+        return scores
+
+    def _gives_check(self, move: chess.Move) -> bool:
+        """
+        Same as `board.gives_check`, but with bitboards instead of
+        pushing and popping the move: checks whether the moved piece
+        attacks the enemy king, or uncovers an attack of a slider.
+        Castling and en passant moves are left to `board.gives_check`.
+        """
+        board = self.board
+        if board.is_castling(move) or board.is_en_passant(move):
+            return board.gives_check(move)
+        color = board.turn
+        king = board.king(not color)
+        if king is None:
+            return False
+        from_square = move.from_square
+        to_square = move.to_square
+        from_mask = chess.BB_SQUARES[from_square]
+        occupied = (board.occupied & ~from_mask) | chess.BB_SQUARES[to_square]
+        # Direct check
+        piece_type = move.promotion or board.piece_type_at(from_square)
+        if piece_type == chess.PAWN:
+            attacks = chess.BB_PAWN_ATTACKS[color][to_square]
+        elif piece_type == chess.KNIGHT:
+            attacks = chess.BB_KNIGHT_ATTACKS[to_square]
+        elif piece_type == chess.KING:
+            attacks = 0
+        else:
+            attacks = 0
+            if piece_type != chess.ROOK:
+                attacks |= chess.BB_DIAG_ATTACKS[to_square][chess.BB_DIAG_MASKS[to_square] & occupied]
+            if piece_type != chess.BISHOP:
+                attacks |= chess.BB_RANK_ATTACKS[to_square][chess.BB_RANK_MASKS[to_square] & occupied]
+                attacks |= chess.BB_FILE_ATTACKS[to_square][chess.BB_FILE_MASKS[to_square] & occupied]
+        if attacks & chess.BB_SQUARES[king]:
+            return True
+        # Discovered check, by the other sliders of the side to play
+        sliders = board.occupied_co[color] & ~from_mask
+        rook_lines = chess.BB_RANK_ATTACKS[king][chess.BB_RANK_MASKS[king] & occupied]
+        rook_lines |= chess.BB_FILE_ATTACKS[king][chess.BB_FILE_MASKS[king] & occupied]
+        if rook_lines & (board.rooks | board.queens) & sliders:
+            return True
+        bishop_lines = chess.BB_DIAG_ATTACKS[king][chess.BB_DIAG_MASKS[king] & occupied]
+        return bool(bishop_lines & (board.bishops | board.queens) & sliders)
 
     def piece_legal_moves(self, piece_pos: str) -> List[chess.Move]:
         """
         Returns a list containing all the legal
         moves for a given piece.
         """
-        return [move for move in self.legal_moves() if str(move)[0:2] == piece_pos]
+        from_mask = chess.BB_SQUARES[chess.parse_square(piece_pos)]
+        return list(self.board.generate_legal_moves(from_mask=from_mask))
 
     def play(self, move: Union[str, chess.Move]) -> None:
         """
@@ -68,26 +218,75 @@ class ChessGame:
         In this example, the first move (white) used a string as an input and
         the second one (black) used a `chess.Move` object as an input.
         """
-        if type(move) == str:
-            self._play_move_from_string(move)
-        elif type(move) == chess.Move:
-            self._play_move_from_chess_move_class(move)
-        else:
-            raise ValueError("Move is neither a string nor a chess.Move")
-        self.hash = self.hash_game()
-
-    def _play_move_from_string(self, move: str) -> None:
-        self.board.push(chess.Move.from_uci(move))
-
-    def _play_move_from_chess_move_class(self, move: chess.Move) -> None:
+        if not isinstance(move, chess.Move):
+            if not isinstance(move, str):
+                raise ValueError("Move is neither a string nor a chess.Move")
+            move = chess.Move.from_uci(move)
+        # The turn always changes, the castling and en passant
+        # keys are taken out before the move and put back after it
+        game_hash = self._hash_stack[-1] ^ self._hash_move(move) ^ self._hash_extras() ^ ChessGame.ZOBRIST_ARRAY[780]
         self.board.push(move)
+        self._hash_stack.append(game_hash ^ self._hash_extras())
+
+    def _hash_move(self, move: chess.Move) -> int:
+        """
+        Returns the XOR of the Zobrist keys of the pieces that
+        the move (not yet played) takes out of or puts in squares.
+        """
+        if not move:
+            return 0
+        board = self.board
+        keys = ChessGame.ZOBRIST_ARRAY
+        color = int(board.turn)
+        from_square = move.from_square
+        to_square = move.to_square
+        piece_type = board.piece_type_at(from_square)
+        # The key of a piece in a square is keys[128 * (piece_type - 1) + 64 * color + square]
+        piece_index = 128 * (piece_type - 1) + 64 * color
+        move_hash = keys[piece_index + from_square]
+        if board.is_castling(move):
+            rank_start = from_square - chess.square_file(from_square)
+            rook_index = 128 * (chess.ROOK - 1) + 64 * color
+            if board.rooks & board.occupied_co[color] & chess.BB_SQUARES[to_square]:
+                rook_from = to_square
+            else:
+                rook_from = rank_start + (7 if to_square > from_square else 0)
+            if rook_from > from_square:
+                king_to, rook_to = rank_start + 6, rank_start + 5
+            else:
+                king_to, rook_to = rank_start + 2, rank_start + 3
+            move_hash ^= keys[piece_index + king_to] ^ keys[rook_index + rook_from] ^ keys[rook_index + rook_to]
+            return move_hash
+        if board.is_en_passant(move):
+            captured_square = to_square - 8 if color else to_square + 8
+            move_hash ^= keys[64 * (1 - color) + captured_square]
+        else:
+            captured_type = board.piece_type_at(to_square)
+            if captured_type is not None:
+                move_hash ^= keys[128 * (captured_type - 1) + 64 * (1 - color) + to_square]
+        if move.promotion:
+            piece_index = 128 * (move.promotion - 1) + 64 * color
+        move_hash ^= keys[piece_index + to_square]
+        return move_hash
+
+    def _hash_extras(self) -> int:
+        """
+        Returns the Zobrist keys of the castling
+        rights and en passant square of the board.
+        """
+        board = self.board
+        extras = 0
+        if board.castling_rights:
+            extras ^= ChessGame.ZOBRIST_HASHER.hash_castling(board)
+        if board.ep_square is not None:
+            extras ^= ChessGame.ZOBRIST_HASHER.hash_ep_square(board)
+        return extras
 
     def play_by_san(self, move: str) -> None:
         """
         Plays a move according to a given SAN (Standard Algebraic Notation).
         """
-        self.board.push_san(move)
-        self.hash = self.hash_game()
+        self.play(self.board.parse_san(move))
 
     def parse_san(self, move: str) -> chess.Move:
         return self.board.parse_san(move)
@@ -96,26 +295,59 @@ class ChessGame:
         """
         Returns a matrix in which each element corresponds
         to a piece or a blank square (".") in the board.
+        The first row is the 8th rank, as in `str(board)`.
         """
-        matrix = str(self.board).split("\n")
-        matrix = [line.split(" ") for line in matrix]
+        board = self.board
+        matrix = [["."] * 8 for _ in range(8)]
+        for color in chess.COLORS:
+            for piece_type in chess.PIECE_TYPES:
+                symbol = chess.piece_symbol(piece_type)
+                if color == chess.WHITE:
+                    symbol = symbol.upper()
+                for square in chess.scan_forward(board.pieces_mask(piece_type, color)):
+                    matrix[7 - chess.square_rank(square)][chess.square_file(square)] = symbol
         return matrix
 
+    def piece_map(self) -> Dict[chess.Square, chess.Piece]:
+        """
+        Returns a dictionary with the pieces of the board
+        by square (a1 = 0, ..., h8 = 63). Blank squares
+        are left out.
+        """
+        return self.board.piece_map()
+
     def has_finished(self) -> bool:
         """
         Returns True if the game has
         finished. Returns False otherwise.
+
+        Checkmates, stalemates and insufficient material depend
+        only on the position, so they are cached by its hash as
+        the sorted legal moves. The seventy-five-move and fivefold
+        repetition rules depend on the moves played before.
         """
-        if self.board.result() == "*":
-            return False
-        return True
+        board = self.board
+        game_hash = self.hash
+        finished = self._finished_cache.get(game_hash, None)
+        if finished is None:
+            finished = not any(board.generate_legal_moves()) or board.is_insufficient_material()
+            self._finished_cache[game_hash] = finished
+            if len(self._finished_cache) > ChessGame.FINISHED_CACHE_SIZE:
+                self._finished_cache.popitem(last=False)
+        else:
+            self._finished_cache.move_to_end(game_hash)
+        return finished or board.is_seventyfive_moves() or board.is_fivefold_repetition()
 
     def pop_play(self) -> None:
         """
         Undo one move.
         """
         self.board.pop()
-        self.hash = self.hash_game()
+        if len(self._hash_stack) > 1:
+            self._hash_stack.pop()
+        else:
+            # The board had moves before the game was created, whose hashes aren't stacked
+            self._hash_stack[-1] = self.hash_game()
 
     def white_to_play(self) -> bool:
         """
@@ -126,64 +358,194 @@ class ChessGame:
 
     def child_game_copy(self, move: Union[str, chess.Move]) -> "ChessGame":
         """
-        Do not use this method.
+        Do not use this method. The search uses `play` and
+        `pop_play` on a single game instead of copying it.
 
         Returns a copy of what a chess game would be if the
         given move is played.
         """
-        child_game_board = deepcopy(self.board)
+        warnings.warn("child_game_copy is deprecated, use play and pop_play instead", DeprecationWarning, stacklevel=2)
+        child_game_board = self.board.copy(stack=False)
         child_game = ChessGame(board=child_game_board)
         child_game.play(move)
         return child_game
 
-    def hash_game(self) -> str:
+    @property
+    def hash(self) -> int:
         """
-        Returns the current board's FEN. It's a string that
-        represents the board and current state of the game.
+        Zobrist hash of the current position, updated
+        incrementally by `play` and `pop_play`.
         """
-        fen = self.board.fen()
-        hash = " ".join(fen.split(" ")[:-2])
-        return hash
+        return self._hash_stack[-1]
+
+    def hash_game(self) -> int:
+        """
+        Computes the Zobrist hash of the current position from scratch.
+        It's the Polyglot hash (`chess.polyglot.zobrist_hash`).
+        """
+        return ChessGame.ZOBRIST_HASHER(self.board)
+
+    def opening_key(self) -> str:
+        """
+        Returns the current board's Zobrist hash in hexadecimal.
+        It's the key used by the opening database file, and the
+        key of the position in Polyglot opening books.
+        """
+        return f"{self.hash:016x}"
 
 
 class ChessGameByFen(ChessGame):
+    __slots__ = ()
+
     def __init__(self, fen: str) -> None:
         board = chess.Board(fen)
         super().__init__(board)
 
 
 class ChessEngine:
-    MATE_PUNCTUATION = 100
-    PUNCTUATIONS = {
-        "R": 5,
-        "N": 3,
-        "B": 3,
-        "Q": 9,
-        "P": 1,
-        "r": -5,
-        "n": -3,
-        "b": -3,
-        "q": -9,
-        "p": -1,
+    # Values are given in thousandths of a pawn, so they are integers
+    MATE_PUNCTUATION = 100000
+    # Bound of every value, used as an infinite value by the searches
+    INFINITY = 10**9
+    # Width of the null windows, the smallest difference between two values
+    NULL_WINDOW = 1
+    # Pieces' values, indexed by piece type (the king isn't counted)
+    PIECE_VALUES = (0, 1000, 3000, 3000, 5000, 9000, 0)
+    # Piece-square tables, in centipawns, from the Simplified Evaluation
+    # Function. They are written from white's point of view with the
+    # 8th rank first, so white's squares are looked up rank-mirrored.
+    # fmt: off
+    PIECE_SQUARE_TABLES = {
+        chess.PAWN: (
+            0, 0, 0, 0, 0, 0, 0, 0,
+            50, 50, 50, 50, 50, 50, 50, 50,
+            10, 10, 20, 30, 30, 20, 10, 10,
+            5, 5, 10, 25, 25, 10, 5, 5,
+            0, 0, 0, 20, 20, 0, 0, 0,
+            5, -5, -10, 0, 0, -10, -5, 5,
+            5, 10, 10, -20, -20, 10, 10, 5,
+            0, 0, 0, 0, 0, 0, 0, 0,
+        ),
+        chess.KNIGHT: (
+            -50, -40, -30, -30, -30, -30, -40, -50,
+            -40, -20, 0, 0, 0, 0, -20, -40,
+            -30, 0, 10, 15, 15, 10, 0, -30,
+            -30, 5, 15, 20, 20, 15, 5, -30,
+            -30, 0, 15, 20, 20, 15, 0, -30,
+            -30, 5, 10, 15, 15, 10, 5, -30,
+            -40, -20, 0, 5, 5, 0, -20, -40,
+            -50, -40, -30, -30, -30, -30, -40, -50,
+        ),
+        chess.BISHOP: (
+            -20, -10, -10, -10, -10, -10, -10, -20,
+            -10, 0, 0, 0, 0, 0, 0, -10,
+            -10, 0, 5, 10, 10, 5, 0, -10,
+            -10, 5, 5, 10, 10, 5, 5, -10,
+            -10, 0, 10, 10, 10, 10, 0, -10,
+            -10, 10, 10, 10, 10, 10, 10, -10,
+            -10, 5, 0, 0, 0, 0, 5, -10,
+            -20, -10, -10, -10, -10, -10, -10, -20,
+        ),
+        chess.ROOK: (
+            0, 0, 0, 0, 0, 0, 0, 0,
+            5, 10, 10, 10, 10, 10, 10, 5,
+            -5, 0, 0, 0, 0, 0, 0, -5,
+            -5, 0, 0, 0, 0, 0, 0, -5,
+            -5, 0, 0, 0, 0, 0, 0, -5,
+            -5, 0, 0, 0, 0, 0, 0, -5,
+            -5, 0, 0, 0, 0, 0, 0, -5,
+            0, 0, 0, 5, 5, 0, 0, 0,
+        ),
+        chess.QUEEN: (
+            -20, -10, -10, -5, -5, -10, -10, -20,
+            -10, 0, 0, 0, 0, 0, 0, -10,
+            -10, 0, 5, 5, 5, 5, 0, -10,
+            -5, 0, 5, 5, 5, 5, 0, -5,
+            0, 0, 5, 5, 5, 5, 0, -5,
+            -10, 5, 5, 5, 5, 5, 0, -10,
+            -10, 0, 5, 0, 0, 0, 0, -10,
+            -20, -10, -10, -5, -5, -10, -10, -20,
+        ),
+        chess.KING: (
+            -30, -40, -40, -50, -50, -40, -40, -30,
+            -30, -40, -40, -50, -50, -40, -40, -30,
+            -30, -40, -40, -50, -50, -40, -40, -30,
+            -30, -40, -40, -50, -50, -40, -40, -30,
+            -20, -30, -30, -40, -40, -30, -30, -20,
+            -10, -20, -20, -20, -20, -20, -20, -10,
+            20, 20, 0, 0, 0, 0, 20, 20,
+            20, 30, 10, 0, 0, 10, 30, 20,
+        ),
     }
-    WINDOW = 0.25
+    # fmt: on
+    # Squares of the center control evaluation. Each side's outer center
+    # is the ring around the center, shifted towards the opponent's side
+    CENTER_MASK = chess.BB_D4 | chess.BB_D5 | chess.BB_E4 | chess.BB_E5
+    WHITE_OUTER_CENTER_MASK = (
+        chess.BB_C6 | chess.BB_D6 | chess.BB_E6 | chess.BB_F6 | chess.BB_C5 | chess.BB_F5 | chess.BB_C4 | chess.BB_F4
+    )
+    BLACK_OUTER_CENTER_MASK = (
+        chess.BB_C5 | chess.BB_F5 | chess.BB_C4 | chess.BB_F4 | chess.BB_C3 | chess.BB_D3 | chess.BB_E3 | chess.BB_F3
+    )
+    WINDOW = 250
+    # Failed aspiration searches before searching with the full window
+    ASPIRATION_FAILS = 3
+    # Bound of the history heuristic's scores
+    MAX_HISTORY = 1 << 14
+    # Depth reduction of the null move search, tried from 'NULL_MOVE_MIN_DEPTH'
+    NULL_MOVE_REDUCTION = 2
+    NULL_MOVE_MIN_DEPTH = 3
+    # Number of slots of the 'tree_memory' (must be a power of two)
+    TREE_MEMORY_SIZE = 1 << 20
+    # Kinds of values stored for a node in the 'tree_memory'
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+    # Opening database, loaded by the first engine
+    _opening_sheet = None
+
+    __slots__ = (
+        "tree_memory",
+        "opening_sheet",
+        "searches",
+        "killer_moves",
+        "root_ply",
+        "history",
+        "depth",
+        "algorithm",
+    )
 
     def __init__(self, depth: int = 6, algorithm: Literal["minimax", "abp", "abpi", "pvs"] = "abpi") -> None:
-        self.games_dictionary = dict()
-        self.tree_values_memory = dict()
-        self.tree_moves_memory = dict()
-        self.tree_height_memory = dict()
-        self.tree_time_memory = dict()
-        self.opening_sheet = dict()
-
-        self.legal_moves = dict()  # dict[str, List[chess.Move]]
-        self.legal_moves_depth = dict()  # dict[str, int]
-        self.legal_moves_validity = dict()  # dict[str, int]
+        # Each slot holds (hash, value, flag, height, move, ordered_moves, search)
+        # or None. 'ordered_moves' are the searched moves, best first, and
+        # 'search' is the number of the search ('searches') that wrote it.
+        # Moves are packed into 16-bit ints (see '_pack_move')
+        self.tree_memory = [None] * ChessEngine.TREE_MEMORY_SIZE
+        self.opening_sheet = ChessEngine._load_opening_sheet()
+
+        self.searches = 0
+        # Last two quiet moves that caused a cutoff at each ply of the search
+        self.killer_moves = []  # List[List[int]], of packed moves
+        self.root_ply = 0
+        # Cutoff scores of quiet moves, by color and by 64 * from_square + to_square
+        self.history = []  # List[List[int]]
 
         self.depth = depth
         self.algorithm = algorithm
-        with open("opening_parser/opening_sheet.json", "r") as f:
-            self.opening_sheet = json.load(f)
+
+    @classmethod
+    def _load_opening_sheet(cls) -> dict:
+        """
+        Reads the opening database on the first call
+        and shares it between all the engines. The sheet
+        is converted to a dictionary from the positions'
+        hashes (its hexadecimal keys) to the parsed moves.
+        """
+        if cls._opening_sheet is None:
+            with open("opening_parser/opening_sheet.json", "r") as f:
+                opening_sheet = json.load(f)
+            cls._opening_sheet = {int(key, 16): chess.Move.from_uci(move) for key, move in opening_sheet.items()}
+        return cls._opening_sheet
 
     def best_move(self, chess_game: ChessGame) -> chess.Move:
         """
@@ -209,27 +571,9 @@ class ChessEngine:
         elif self.algorithm == "pvs":
             _, best_move = self._call_pvs(chess_game)
 
-        # Improvements related to repeated calculations
+        # Older searches' slots of the 'tree_memory' can be replaced
         if self.algorithm == "abpi" or self.algorithm == "pvs":
-            stored_positions = [position for position in self.tree_height_memory]
-            for position in stored_positions:
-                remaining_time = self.tree_time_memory[position]
-                if remaining_time == 0:
-                    del self.tree_values_memory[position]
-                    del self.tree_moves_memory[position]
-                    del self.tree_height_memory[position]
-                    del self.tree_time_memory[position]
-                else:
-                    self.tree_time_memory[position] -= 1
-            stored_positions_for_legal_moves = [position for position in self.legal_moves_validity]
-            for position in stored_positions_for_legal_moves:
-                remaining_validity = self.legal_moves_validity[position]
-                if remaining_validity == 0:
-                    del self.legal_moves[position]
-                    del self.legal_moves_depth[position]
-                    del self.legal_moves_validity[position]
-                else:
-                    self.legal_moves_validity[position] -= 1
+            self.searches += 1
         return best_move
 
     def _try_to_get_opening_move(self, chess_game: ChessGame) -> chess.Move:
@@ -238,12 +582,9 @@ class ChessEngine:
         recorded in the opening database. If it is among
         them, return the suggested move. Else, return None.
         """
-        move = self.opening_sheet.get(chess_game.hash, None)
-        if move is None:
-            return None
-        return chess.Move.from_uci(move)
+        return self.opening_sheet.get(chess_game.hash, None)
 
-    def _minimax(self, chess_game: ChessGame, depth: int) -> Tuple[float, chess.Move]:
+    def _minimax(self, chess_game: ChessGame, depth: int) -> Tuple[int, chess.Move]:
         """
         Implements Minimax algorithm to find the next
         move given for a Chess board configuration.
@@ -252,9 +593,9 @@ class ChessEngine:
             return self._evaluate_game_node(chess_game), None
         # White's turn (maximizing)
         if chess_game.white_to_play():
-            best_value = -inf
+            best_value = -ChessEngine.INFINITY
             best_move = None
-            for move in chess_game.legal_moves():
+            for move in chess_game.board.generate_legal_moves():
                 chess_game.play(move)
                 value, _ = self._minimax(chess_game, depth - 1)
                 chess_game.pop_play()
@@ -263,9 +604,9 @@ class ChessEngine:
                     best_value = value
             return best_value, best_move
         # Black's turn (minimizing)
-        best_value = +inf
+        best_value = +ChessEngine.INFINITY
         best_move = None
-        for move in chess_game.legal_moves():
+        for move in chess_game.board.generate_legal_moves():
             chess_game.play(move)
             value, _ = self._minimax(chess_game, depth - 1)
             chess_game.pop_play()
@@ -274,9 +615,7 @@ class ChessEngine:
                 best_value = value
         return best_value, best_move
 
-    def _alpha_beta_basic(
-        self, chess_game: ChessGame, depth: int, alpha: float, beta: float
-    ) -> Tuple[float, chess.Move]:
+    def _alpha_beta_basic(self, chess_game: ChessGame, depth: int, alpha: int, beta: int) -> Tuple[int, chess.Move]:
         """
         Implements the basic Alpha-Beta Pruning
         algorithm, whithout any further improvement.
@@ -285,9 +624,9 @@ class ChessEngine:
             return self._evaluate_game_node(chess_game), None
         # White's turn (maximizing)
         if chess_game.white_to_play():
-            best_value = -inf
+            best_value = -ChessEngine.INFINITY
             best_move = None
-            for move in chess_game.legal_moves():
+            for move in chess_game.board.generate_legal_moves():
                 chess_game.play(move)
                 value, _ = self._alpha_beta_basic(chess_game, depth - 1, alpha, beta)
                 chess_game.pop_play()
@@ -299,9 +638,9 @@ class ChessEngine:
                 alpha = max(alpha, best_value)
             return best_value, best_move
         # Black's turn (minimizing)
-        best_value = +inf
+        best_value = +ChessEngine.INFINITY
         best_move = None
-        for move in chess_game.legal_moves():
+        for move in chess_game.board.generate_legal_moves():
             chess_game.play(move)
             value, _ = self._alpha_beta_basic(chess_game, depth - 1, alpha, beta)
             chess_game.pop_play()
@@ -313,7 +652,7 @@ class ChessEngine:
             beta = min(beta, best_value)
         return best_value, best_move
 
-    def _call_alpha_beta(self, chess_game: ChessGame, improved: bool) -> Tuple[float, chess.Move]:
+    def _call_alpha_beta(self, chess_game: ChessGame, improved: bool) -> Tuple[int, chess.Move]:
         """
         Provides the initial call to the Alpha-Beta Pruning algorithm.
         If 'improved' = True, it calls the improved method. Else
@@ -323,57 +662,72 @@ class ChessEngine:
         beta = +ChessEngine.MATE_PUNCTUATION
         if not improved:
             return self._alpha_beta_basic(chess_game, self.depth, alpha, beta)
-        return self._alpha_beta_improved(chess_game, self.depth, alpha, beta)
+        color = 1 if chess_game.board.turn else -1
+        self._clear_move_ordering_tables(chess_game)
+        # Iterative deepening: each shallower search stores the best
+        # moves that are tried first by the next, deeper one.
+        for depth in range(1, self.depth + 1):
+            value, best_move = self._alpha_beta_improved(chess_game, depth, alpha, beta, color)
+        return color * value, ChessEngine._unpack_move(best_move)
 
     def _alpha_beta_improved(
-        self, chess_game: ChessGame, depth: int, alpha: float, beta: float
-    ) -> Tuple[float, chess.Move]:
+        self, chess_game: ChessGame, depth: int, alpha: int, beta: int, color: int
+    ) -> Tuple[int, int]:
         """
         Implements the basic Alpha-Beta Pruning
         algorithm with some other improvements.
+
+        Negamax form: values are given from the point of view of
+        the side to play, whose sign is 'color' (1 for white).
+        The best move is returned packed, as it's stored.
         """
+        board = chess_game.board
         # Check if node was recently calculated
-        pre_value_move = self._get_node_alpha_beta_value_and_move(chess_game, depth)
-        if pre_value_move[0] is not None:
-            return pre_value_move
-        # Check if leaf or max depth was reached
-        if depth == 0 or chess_game.has_finished():
-            return self._evaluate_game_node(chess_game), None
-
-        best_value = -inf
+        game_hash = chess_game.hash
+        pre_value, pre_move, alpha, beta = self._get_node_alpha_beta_value_and_move(game_hash, depth, alpha, beta)
+        if pre_value is not None:
+            return pre_value, pre_move
+        # Check if leaf or max depth was reached. Checkmates and
+        # stalemates are found below, when there is no move to search
+        if depth == 0:
+            return self._evaluate_leaf_node(chess_game, game_hash, pre_move, depth, alpha, beta, color), None
+        if board.is_insufficient_material():
+            return self._store_terminal_node_value(game_hash, 0, depth), None
+
+        best_value = -ChessEngine.INFINITY
         best_move = None
-        mate_punctuation = ChessEngine.MATE_PUNCTUATION
-
-        white_to_play = 1 if chess_game.white_to_play() else -1
 
-        best_value *= white_to_play
-        mate_punctuation *= white_to_play
+        ply = board.ply() - self.root_ply
+        legal_moves = self._get_legal_moves(chess_game, game_hash, pre_move, ply)
 
-        legal_moves = self._get_legal_moves(chess_game)
-
-        move_value = {a: -mate_punctuation for a in legal_moves}
+        searched_moves = []
+        move_values = []
+        alpha_original, beta_original = alpha, beta
 
         for move in legal_moves:
             chess_game.play(move)
-            alpha_beta, _ = self._alpha_beta_improved(chess_game, depth - 1, alpha, beta)
+            alpha_beta, _ = self._alpha_beta_improved(chess_game, depth - 1, -beta, -alpha, -color)
             chess_game.pop_play()
-            move_value[move] = alpha_beta
-            if (alpha_beta * white_to_play) >= (best_value * white_to_play):
+            alpha_beta = -alpha_beta
+            searched_moves.append(move)
+            move_values.append(alpha_beta)
+            if alpha_beta > best_value:
                 best_move = move
                 best_value = alpha_beta
-            if white_to_play == 1:
-                # alpha = max(alpha, best_value)
                 if best_value > alpha:
                     alpha = best_value
-            else:
-                # beta = min(beta, best_value)
-                if best_value < beta:
-                    beta = best_value
-            if beta <= alpha:
-                break
-        return self._store_node_alpha_beta_value(chess_game, best_value, best_move, depth, move_value)
-
-    def _call_pvs(self, chess_game: ChessGame) -> Tuple[float, chess.Move]:
+                    if alpha >= beta:
+                        self._store_cutoff_move(board, move, ply, depth)
+                        break
+        if best_move is None:
+            # Checkmate or stalemate
+            value = -ChessEngine.MATE_PUNCTUATION if board.is_check() else 0
+            return self._store_terminal_node_value(game_hash, value, depth), None
+        return self._store_node_alpha_beta_value(
+            game_hash, best_value, best_move, depth, searched_moves, move_values, alpha_original, beta_original
+        )
+
+    def _call_pvs(self, chess_game: ChessGame) -> Tuple[int, chess.Move]:
         """
         Out of CT-213 Exam's scope!
 
@@ -383,257 +737,538 @@ class ChessEngine:
         mtd = True
         best_move = None
         score = None
-        if aspiration:
-            previous = self.tree_values_memory.get(chess_game.hash, 0)
-            alpha = previous - ChessEngine.WINDOW
-            beta = previous + ChessEngine.WINDOW
-            while True:
-                score, best_move = self._alpha_beta_recursion_pvs(chess_game, self.depth, alpha, beta)
-                if score <= alpha:
-                    alpha = -ChessEngine.MATE_PUNCTUATION
-                elif score >= beta:
-                    beta = ChessEngine.MATE_PUNCTUATION
-                else:
-                    break
-        elif mtd:
-            test = 0
-            while True:
-                score, best_move = self._alpha_beta_recursion_pvs(chess_game, self.depth, test-0.005, test + 0.005)
-                if test == score:
-                    break
-                test = score
-        else:
-            alpha = -ChessEngine.MATE_PUNCTUATION
-            beta = +ChessEngine.MATE_PUNCTUATION
-            score, best_move = self._alpha_beta_recursion_pvs(chess_game, self.depth, alpha, beta)
-        return score, best_move
+        color = 1 if chess_game.board.turn else -1
+        self._clear_move_ordering_tables(chess_game)
+        # Iterative deepening, as in '_call_alpha_beta'
+        for depth in range(1, self.depth + 1):
+            if aspiration:
+                entry = self._get_tree_memory_entry(chess_game.hash)
+                previous = 0 if entry is None else entry[1]
+                window = ChessEngine.WINDOW
+                alpha = previous - window
+                beta = previous + window
+                fails = 0
+                while True:
+                    score, best_move = self._alpha_beta_recursion_pvs(chess_game, depth, alpha, beta, color)
+                    if (score > alpha and score < beta) or fails >= ChessEngine.ASPIRATION_FAILS:
+                        break
+                    # Widen the failed side of the window geometrically,
+                    # and open it completely after a few failures
+                    fails += 1
+                    if fails >= ChessEngine.ASPIRATION_FAILS:
+                        alpha = -ChessEngine.MATE_PUNCTUATION
+                        beta = ChessEngine.MATE_PUNCTUATION
+                    elif score <= alpha:
+                        alpha -= window
+                    else:
+                        beta += window
+                    window *= 4
+            elif mtd:
+                # Each null window search around 'test' either finds the
+                # value or moves one of its bounds past 'test', so the loop
+                # ends even if the searches' bounds are inconsistent
+                test = 0 if score is None else score
+                lower, upper = -ChessEngine.INFINITY, ChessEngine.INFINITY
+                while lower < upper:
+                    score, best_move = self._alpha_beta_recursion_pvs(
+                        chess_game, depth, test - ChessEngine.NULL_WINDOW, test + ChessEngine.NULL_WINDOW, color
+                    )
+                    if score <= test - ChessEngine.NULL_WINDOW:
+                        upper = score
+                    elif score >= test + ChessEngine.NULL_WINDOW:
+                        lower = score
+                    else:
+                        break
+                    test = score
+            else:
+                alpha = -ChessEngine.MATE_PUNCTUATION
+                beta = +ChessEngine.MATE_PUNCTUATION
+                score, best_move = self._alpha_beta_recursion_pvs(chess_game, depth, alpha, beta, color)
+        return color * score, ChessEngine._unpack_move(best_move)
 
     def _alpha_beta_recursion_pvs(
-        self, chess_game: ChessGame, depth: int, alpha: float, beta: float
-    ) -> Tuple[float, chess.Move]:
+        self, chess_game: ChessGame, depth: int, alpha: int, beta: int, color: int
+    ) -> Tuple[int, int]:
         """
         Out of CT-213 Exam's scope!
 
-        Implementation of Alpha-Beta Pruning PVS variation.
+        Implementation of Alpha-Beta Pruning PVS variation,
+        in negamax form as '_alpha_beta_improved'.
         """
-        pre_value_move = self._get_node_alpha_beta_value_and_move(chess_game, depth)
-        if pre_value_move[0] is not None:
-            return pre_value_move
-
-        if depth == 0 or chess_game.has_finished():
-            return self._evaluate_game_node(chess_game), None
-
-        best_value = -inf
+        board = chess_game.board
+        game_hash = chess_game.hash
+        pre_value, pre_move, alpha, beta = self._get_node_alpha_beta_value_and_move(game_hash, depth, alpha, beta)
+        if pre_value is not None:
+            return pre_value, pre_move
+
+        if depth == 0:
+            return self._evaluate_leaf_node(chess_game, game_hash, pre_move, depth, alpha, beta, color), None
+        if board.is_insufficient_material():
+            return self._store_terminal_node_value(game_hash, 0, depth), None
+
+        ply = board.ply() - self.root_ply
+        if ply > 0:
+            null_value = self._null_move_value(chess_game, depth, beta, color)
+            if null_value is not None and null_value >= beta:
+                return null_value, None
+
+        best_value = -ChessEngine.INFINITY
         best_move = None
-        mate_punctuation = ChessEngine.MATE_PUNCTUATION
 
-        white_to_play = 1 if chess_game.white_to_play() else -1
+        legal_moves = self._get_legal_moves(chess_game, game_hash, pre_move, ply)
 
-        best_value *= white_to_play
-        mate_punctuation *= white_to_play
-
-        legal_moves = self._get_legal_moves(chess_game)
-
-        move_value = {a: -mate_punctuation for a in legal_moves}
+        searched_moves = []
+        move_values = []
+        alpha_original, beta_original = alpha, beta
 
         for move in legal_moves:
             chess_game.play(move)
-            alpha_beta = 0
             if best_move is None:
-                alpha_beta, _ = self._alpha_beta_recursion_pvs(chess_game, depth - 1, alpha, beta)
-                best_move = move
-                best_value = alpha_beta
-                chess_game.pop_play()
-                continue
+                alpha_beta, _ = self._alpha_beta_recursion_pvs(chess_game, depth - 1, -beta, -alpha, -color)
+                alpha_beta = -alpha_beta
             else:
-                alpha_beta, _ = self._alpha_beta_recursion_pvs(chess_game, depth - 1, alpha, alpha + 0.005)
+                # Null window just above alpha
+                alpha_beta, _ = self._alpha_beta_recursion_pvs(
+                    chess_game, depth - 1, -alpha - ChessEngine.NULL_WINDOW, -alpha, -color
+                )
+                alpha_beta = -alpha_beta
                 if alpha_beta > alpha and alpha_beta < beta:
-                    alpha_beta, _ = self._alpha_beta_recursion_pvs(chess_game, depth - 1, alpha, beta)
+                    alpha_beta, _ = self._alpha_beta_recursion_pvs(chess_game, depth - 1, -beta, -alpha, -color)
+                    alpha_beta = -alpha_beta
             chess_game.pop_play()
-            move_value[move] = alpha_beta
-            if (alpha_beta * white_to_play) >= (best_value * white_to_play):
+            searched_moves.append(move)
+            move_values.append(alpha_beta)
+            if alpha_beta > best_value:
                 best_move = move
                 best_value = alpha_beta
-            if white_to_play == 1:
-                # alpha = max(alpha, best_value)
-                if best_value >= alpha:
+                if best_value > alpha:
                     alpha = best_value
-            else:
-                # beta = min(beta, best_value)
-                if best_value <= beta:
-                    beta = best_value
-            if alpha >= beta:
+                    if alpha >= beta:
+                        self._store_cutoff_move(board, move, ply, depth)
+                        break
+        if best_move is None:
+            # Checkmate or stalemate
+            value = -ChessEngine.MATE_PUNCTUATION if board.is_check() else 0
+            return self._store_terminal_node_value(game_hash, value, depth), None
+        return self._store_node_alpha_beta_value(
+            game_hash, best_value, best_move, depth, searched_moves, move_values, alpha_original, beta_original
+        )
+
+    def _null_move_value(self, chess_game: ChessGame, depth: int, beta: int, color: int) -> int:
+        """
+        Null move pruning: lets the side to play pass and searches the
+        position with a reduced depth and a null window at beta. If
+        passing still fails high, a real move is assumed to do so too,
+        and the value found by passing is returned as a fail-soft bound;
+        returning beta itself makes MTD(f) creep one window at a time.
+        Mate scores aren't trusted, since they may depend on the pass.
+        It isn't tried in check, right after another null move or when
+        the side to play has only pawns, where zugzwang is common.
+        Returns None when the null move isn't tried.
+        """
+        board = chess_game.board
+        if depth < ChessEngine.NULL_MOVE_MIN_DEPTH or board.is_check():
+            return None
+        if board.move_stack and not board.move_stack[-1]:
+            return None
+        if not board.occupied_co[board.turn] & ~(board.pawns | board.kings):
+            return None
+        chess_game.play(chess.Move.null())
+        null_value, _ = self._alpha_beta_recursion_pvs(
+            chess_game, depth - 1 - ChessEngine.NULL_MOVE_REDUCTION, -beta, -beta + ChessEngine.NULL_WINDOW, -color
+        )
+        chess_game.pop_play()
+        if -null_value >= ChessEngine.MATE_PUNCTUATION:
+            return beta
+        return -null_value
+
+    def _clear_move_ordering_tables(self, chess_game: ChessGame) -> None:
+        """
+        Starts empty killer moves and history tables
+        for a search from the given game.
+        """
+        self.killer_moves = [[None, None] for _ in range(self.depth + 1)]
+        self.root_ply = chess_game.board.ply()
+        self.history = [[0] * 4096, [0] * 4096]
+
+    def _store_cutoff_move(self, board: chess.Board, move: chess.Move, ply: int, depth: int) -> None:
+        """
+        Keeps a quiet move that caused a cutoff as the newest of the two
+        killer moves of the ply, which are tried early in sibling nodes,
+        and raises its history score by depth^2. The score is pulled
+        down as it gets near 'MAX_HISTORY', so it stays bounded.
+        """
+        if board.is_capture(move):
+            return
+        packed_move = ChessEngine._pack_move(move)
+        killer_moves = self.killer_moves[ply]
+        if killer_moves[0] != packed_move:
+            killer_moves[1] = killer_moves[0]
+            killer_moves[0] = packed_move
+        history = self.history[board.turn]
+        index = 64 * move.from_square + move.to_square
+        bonus = depth * depth
+        history[index] += bonus - history[index] * bonus // ChessEngine.MAX_HISTORY
+
+    def _get_legal_moves(self, chess_game: ChessGame, game_hash: int, best_move: int, ply: int) -> Iterator[chess.Move]:
+        """
+        Yields the legal moves lazily, so a cutoff stops the generation:
+        first the best move previously stored for the position, then the
+        moves ordered by a previous search (stored in the 'tree_memory')
+        and finally the remaining ones: the captures and checks first, then
+        the ply's killer moves (if legal) and the quiet moves by history.
+        The stored moves are packed, and are only unpacked when yielded.
+        """
+        board = chess_game.board
+        pack_move = ChessEngine._pack_move
+        unpack_move = ChessEngine._unpack_move
+        searched = set()
+        if best_move is not None:
+            searched.add(best_move)
+            yield unpack_move(best_move)
+        entry = self._get_tree_memory_entry(game_hash)
+        if entry is not None and entry[5] is not None:
+            for packed_move in entry[5]:
+                if packed_move not in searched:
+                    searched.add(packed_move)
+                    yield unpack_move(packed_move)
+        legal_moves = chess_game._legal_moves_sorted()
+        for index, move in enumerate(legal_moves):
+            if not board.is_capture(move):
                 break
-        return self._store_node_alpha_beta_value(chess_game, best_value, best_move, depth, move_value)
+            packed_move = pack_move(move)
+            if packed_move not in searched:
+                # Killers are taken from sibling nodes, so they may be captures here
+                searched.add(packed_move)
+                yield move
+        else:
+            return
+        for packed_move in self.killer_moves[ply]:
+            if packed_move is not None and packed_move not in searched:
+                killer_move = unpack_move(packed_move)
+                if board.is_legal(killer_move):
+                    searched.add(packed_move)
+                    yield killer_move
+        history = self.history[board.turn]
+        quiet_moves = sorted(
+            legal_moves[index:], key=lambda move: history[64 * move.from_square + move.to_square], reverse=True
+        )
+        for move in quiet_moves:
+            if pack_move(move) not in searched:
+                yield move
+
+    @staticmethod
+    def _pack_move(move: chess.Move) -> int:
+        """
+        Packs a move into a 16-bit int, as it's kept by the 'tree_memory'
+        and the killer moves tables: from_square << 10 | to_square << 4 |
+        promotion. The ints are much smaller than 'chess.Move' objects.
+        """
+        return move.from_square << 10 | move.to_square << 4 | (move.promotion or 0)
 
-    def _get_legal_moves(self, chess_game: ChessGame) -> List[chess.Move]:
+    @staticmethod
+    def _unpack_move(packed_move: int) -> chess.Move:
         """
-        Checks if the 'legal_moves' dictionary already contains
-        the moves for the current board configuration.
+        Rebuilds a move packed by '_pack_move' (None is kept).
         """
-        legal_moves = self.legal_moves.get(chess_game.hash, None)
-        if legal_moves:
-            return legal_moves
-        return chess_game.legal_moves()
+        if packed_move is None:
+            return None
+        return chess.Move(packed_move >> 10, packed_move >> 4 & 63, packed_move & 15 or None)
 
-    def _set_legal_moves(self, chess_game: ChessGame, move_value: dict, depth: int) -> None:
+    def _get_node_alpha_beta_value_and_move(
+        self, game_hash: int, height: int, alpha: int, beta: int
+    ) -> Tuple[int, int, int, int]:
         """
-        Saves the legal moves to the 'legal_moves' dictionary,
-        ordering them by the values calculated in the current iteration.
+        Checks if node was recently calculated. If the stored value is
+        exact, or if it's a bound that causes a cutoff in the given window,
+        return it and the respective move. Otherwise, return None, the
+        stored move (to be searched first) and the window narrowed by
+        the stored bound.
         """
-        self.legal_moves_validity[chess_game.hash] = self.depth + 1
-        stored_depth = self.legal_moves_depth.get(chess_game.hash, 0)
-        if stored_depth < depth:
-            move_value_list = sorted(
-                [move for move in move_value],
-                key=lambda move: move_value[move],
-                reverse=chess_game.white_to_play(),
-            )
-            self.legal_moves_depth[chess_game.hash] = depth
-            self.legal_moves[chess_game.hash] = move_value_list
+        entry = self._get_tree_memory_entry(game_hash)
+        if entry is None:
+            return None, None, alpha, beta
+        _, value, flag, stored_height, move, _, _ = entry
+        if stored_height < height:
+            return None, move, alpha, beta
+        if flag == ChessEngine.EXACT:
+            return value, move, alpha, beta
+        if flag == ChessEngine.LOWER_BOUND:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            return value, move, alpha, beta
+        return None, move, alpha, beta
+
+    def _get_tree_memory_entry(self, game_hash: int) -> Tuple:
+        """
+        Returns the 'tree_memory' slot of the position,
+        or None if the slot holds another position.
+        """
+        entry = self.tree_memory[game_hash & (ChessEngine.TREE_MEMORY_SIZE - 1)]
+        if entry is None or entry[0] != game_hash:
+            return None
+        return entry
 
-    def _get_node_alpha_beta_value_and_move(self, game: ChessGame, height: int) -> Tuple[float, chess.Move]:
+    def _set_tree_memory_entry(
+        self,
+        game_hash: int,
+        value: int,
+        flag: int,
+        height: int,
+        move: int,
+        ordered_moves: array = None,
+    ) -> None:
         """
-        Checks if node was recently calculated. If it is still
-        stored, return the stored value and respective move.
+        Writes the node to its 'tree_memory' slot. The slot is kept
+        if it holds a deeper search of another node, unless it was
+        written by an older search, so no sweep of stale entries is
+        needed between searches.
         """
-        game_hash = game.hash
-        stored_height = self.tree_height_memory.get(game_hash, None)
-        if stored_height is None:
-            return None, None
-        if stored_height >= height:
-            return self.tree_values_memory.get(game_hash, None), self.tree_moves_memory.get(game_hash, None)
-        return None, None
+        index = game_hash & (ChessEngine.TREE_MEMORY_SIZE - 1)
+        entry = self.tree_memory[index]
+        if entry is None or entry[0] == game_hash or entry[6] != self.searches or entry[3] <= height:
+            self.tree_memory[index] = (game_hash, value, flag, height, move, ordered_moves, self.searches)
 
     def _store_node_alpha_beta_value(
         self,
-        game: ChessGame,
-        alpha_beta_value: float,
+        game_hash: int,
+        alpha_beta_value: int,
         move: chess.Move,
         height: int,
-        move_value: dict,
-    ) -> Tuple[float, chess.Move]:
+        searched_moves: List[chess.Move],
+        move_values: List[int],
+        alpha: int,
+        beta: int,
+    ) -> Tuple[int, int]:
         """
-        Store recent nodes' value and move.
+        Store recent nodes' value and move. A value outside
+        the searched (alpha, beta) window is only a bound.
+        The searched moves are kept too, ordered by the values
+        calculated in this search (best first, as the values are
+        seen by the side to play), in an array of packed moves.
         """
-        game_hash = game.hash
-        self.tree_values_memory[game_hash] = alpha_beta_value
-        self.tree_moves_memory[game_hash] = move
-        self.tree_height_memory[game_hash] = height
-        self.tree_time_memory[game_hash] = height + 1
+        flag = self._get_value_flag(alpha_beta_value, alpha, beta)
+        order = sorted(range(len(searched_moves)), key=move_values.__getitem__, reverse=True)
+        pack_move = ChessEngine._pack_move
+        ordered_moves = array("H", [pack_move(searched_moves[i]) for i in order])
+        packed_move = pack_move(move)
+        self._set_tree_memory_entry(game_hash, alpha_beta_value, flag, height, packed_move, ordered_moves)
+        return alpha_beta_value, packed_move
+
+    def _get_value_flag(self, value: int, alpha: int, beta: int) -> int:
+        """
+        Returns the kind of a value searched in the (alpha, beta)
+        window: a value outside the window is only a bound.
+        """
+        if value <= alpha:
+            return ChessEngine.UPPER_BOUND
+        if value >= beta:
+            return ChessEngine.LOWER_BOUND
+        return ChessEngine.EXACT
+
+    def _evaluate_leaf_node(
+        self,
+        game: ChessGame,
+        game_hash: int,
+        stored_move: int,
+        height: int,
+        alpha: int,
+        beta: int,
+        color: int,
+    ) -> int:
+        """
+        Evaluates a leaf of the negamax searches by a quiescence
+        search and stores it, so transpositions into the same leaf
+        are answered by the 'tree_memory' probe. A position that
+        already has a move stored keeps its (deeper) entry.
+        """
+        value = self._quiesce(game, alpha, beta, color)
+        if stored_move is None:
+            self._set_tree_memory_entry(game_hash, value, self._get_value_flag(value, alpha, beta), height, None)
+        return value
 
-        self._set_legal_moves(game, move_value, height)
-        return alpha_beta_value, move
+    def _store_terminal_node_value(self, game_hash: int, value: int, height: int) -> int:
+        """
+        Stores the value of a checkmate, stalemate or insufficient
+        material node, already known by the search, so the evaluator
+        isn't called for it. The value is exact, whatever the window.
+        """
+        self._set_tree_memory_entry(game_hash, value, ChessEngine.EXACT, height, None)
+        return value
+
+    def _quiesce(self, game: ChessGame, alpha: int, beta: int, color: int) -> int:
+        """
+        Quiescence search: the captures of a leaf are searched until
+        a quiet position is reached, so the evaluation isn't taken in
+        the middle of an exchange. The side to play may also not
+        capture ("stand pat"), so its evaluation is a lower bound.
+        """
+        best_value = color * self._evaluate_game_node(game)
+        if best_value >= beta:
+            return best_value
+        if best_value > alpha:
+            alpha = best_value
+        for move in game._legal_captures_sorted():
+            game.play(move)
+            value = -self._quiesce(game, -beta, -alpha, -color)
+            game.pop_play()
+            if value > best_value:
+                best_value = value
+                if best_value > alpha:
+                    alpha = best_value
+                    if alpha >= beta:
+                        break
+        return best_value
 
-    def _evaluate_game_node(self, game: ChessGame) -> float:
+    def _evaluate_game_node(self, game: ChessGame) -> int:
         """
         Evaluates the advantage or disadvantage of white pieces in a board.
         """
         return self._alternative_evaluation(game.board)
 
-    def _dummy_evaluation(self, board: chess.Board) -> float:
+    def _game_over_evaluation(self, board: chess.Board) -> int:
         """
-        Dummy evaluation. Evaluates considering only
-        checkmates, stalemates and pawn/pieces values.
+        Returns the value of a checkmate, stalemate or insufficient
+        material position, or None if the game goes on. Unlike
+        `board.result()`, legal moves are generated only once and
+        the move-counter and repetition rules are not checked.
         """
-        if board.result() == "0-1":
-            return -ChessEngine.MATE_PUNCTUATION
-        if board.result() == "1-0":
-            return ChessEngine.MATE_PUNCTUATION
-        if board.result() == "1/2-1/2":
+        if not any(board.generate_legal_moves()):
+            if board.is_check():
+                return -ChessEngine.MATE_PUNCTUATION if board.turn else ChessEngine.MATE_PUNCTUATION
             return 0
+        if board.is_insufficient_material():
+            return 0
+        return None
+
+    def _dummy_evaluation(self, board: chess.Board) -> int:
+        """
+        Dummy evaluation. Evaluates considering only checkmates,
+        stalemates, pawn/pieces values and their squares.
+        """
+        game_over_evaluation = self._game_over_evaluation(board)
+        if game_over_evaluation is not None:
+            return game_over_evaluation
 
+        return self._material_evaluation(board) + self._piece_square_evaluation(board)
+
+    def _material_evaluation(self, board: chess.Board) -> int:
+        """
+        Sums the pieces' values using the board's bitboards. Each
+        piece type costs two popcounts instead of scanning 64 squares.
+        """
+        values = ChessEngine.PIECE_VALUES
+        white = board.occupied_co[chess.WHITE]
+        black = board.occupied_co[chess.BLACK]
         evaluation = 0
-        for i in range(64):
-            piece = str(board.piece_at(i))
-            evaluation += ChessEngine.PUNCTUATIONS.get(piece, 0)
+        evaluation += values[chess.PAWN] * (chess.popcount(board.pawns & white) - chess.popcount(board.pawns & black))
+        evaluation += values[chess.KNIGHT] * (
+            chess.popcount(board.knights & white) - chess.popcount(board.knights & black)
+        )
+        evaluation += values[chess.BISHOP] * (
+            chess.popcount(board.bishops & white) - chess.popcount(board.bishops & black)
+        )
+        evaluation += values[chess.ROOK] * (chess.popcount(board.rooks & white) - chess.popcount(board.rooks & black))
+        evaluation += values[chess.QUEEN] * (
+            chess.popcount(board.queens & white) - chess.popcount(board.queens & black)
+        )
         return evaluation
 
-    def _alternative_evaluation(self, board: chess.Board) -> float:
+    def _piece_square_evaluation(self, board: chess.Board) -> int:
+        """
+        Sums the piece-square tables' bonuses of each piece, in
+        thousandths of a pawn. Only the squares set in each piece
+        bitboard are visited.
+        """
+        evaluation = 0
+        for piece_type, table in ChessEngine.PIECE_SQUARE_TABLES.items():
+            for square in chess.scan_forward(board.pieces_mask(piece_type, chess.WHITE)):
+                evaluation += table[square ^ 56]
+            for square in chess.scan_forward(board.pieces_mask(piece_type, chess.BLACK)):
+                evaluation -= table[square]
+        return evaluation * 10
+
+    def _count_attackers(
+        self, board: chess.Board, color: chess.Color, center_mask: chess.Bitboard, outer_center_mask: chess.Bitboard
+    ) -> Tuple[int, int]:
+        """
+        Counts the attacks of the pieces of the given color on the squares
+        of each mask, which is the sum of `board.attackers_mask` popcounts
+        over the squares. The attacks of each piece are found only once,
+        and the pawns' attacks are found together by shifting their bitboard.
+        """
+        popcount = chess.popcount
+        occupied = board.occupied
+        pieces = board.occupied_co[color]
+        pawns = board.pawns & pieces
+        if color == chess.WHITE:
+            left_attacks = (pawns & ~chess.BB_FILE_A) << 7
+            right_attacks = (pawns & ~chess.BB_FILE_H) << 9
+        else:
+            left_attacks = (pawns & ~chess.BB_FILE_A) >> 9
+            right_attacks = (pawns & ~chess.BB_FILE_H) >> 7
+        center = popcount(left_attacks & center_mask) + popcount(right_attacks & center_mask)
+        outer_center = popcount(left_attacks & outer_center_mask) + popcount(right_attacks & outer_center_mask)
+        for square in chess.scan_reversed((board.knights | board.kings) & pieces):
+            if board.knights & chess.BB_SQUARES[square]:
+                attacks = chess.BB_KNIGHT_ATTACKS[square]
+            else:
+                attacks = chess.BB_KING_ATTACKS[square]
+            center += popcount(attacks & center_mask)
+            outer_center += popcount(attacks & outer_center_mask)
+        for square in chess.scan_reversed((board.rooks | board.queens) & pieces):
+            attacks = chess.BB_RANK_ATTACKS[square][chess.BB_RANK_MASKS[square] & occupied]
+            attacks |= chess.BB_FILE_ATTACKS[square][chess.BB_FILE_MASKS[square] & occupied]
+            center += popcount(attacks & center_mask)
+            outer_center += popcount(attacks & outer_center_mask)
+        for square in chess.scan_reversed((board.bishops | board.queens) & pieces):
+            attacks = chess.BB_DIAG_ATTACKS[square][chess.BB_DIAG_MASKS[square] & occupied]
+            center += popcount(attacks & center_mask)
+            outer_center += popcount(attacks & outer_center_mask)
+        return center, outer_center
+
+    def _alternative_evaluation(self, board: chess.Board) -> int:
         """
         Evaluates a board configuration according
         to some Chess heuristics listed below.
         """
-        # MOBILITY_WEIGHT = 0.00001
-        CENTRAL_CONTROL_WEIGHT = 0.05
-        OUTER_CENTRAL_CONTROL_WEIGHT = 0.005
+        # MOBILITY_WEIGHT = 0.01
+        CENTRAL_CONTROL_WEIGHT = 50
+        OUTER_CENTRAL_CONTROL_WEIGHT = 5
         MATERIAL_POINTS_WEIGHT = 1
-        DEVELOPMENT_WEIGHT = 0.1
+        DEVELOPMENT_WEIGHT = 100
 
         # Checkmates and Stalemantes
-        if board.result() == "0-1":
-            return -ChessEngine.MATE_PUNCTUATION
-        if board.result() == "1-0":
-            return ChessEngine.MATE_PUNCTUATION
-        if board.result() == "1/2-1/2":
-            return 0
-
-        board_rows = str(board).split("\n")
+        game_over_evaluation = self._game_over_evaluation(board)
+        if game_over_evaluation is not None:
+            return game_over_evaluation
 
         # Material Evaluation
-        material_points = 0
-        for i in range(64):
-            piece = str(board.piece_at(i))
-            material_points += ChessEngine.PUNCTUATIONS.get(piece, 0)
+        material_points = self._material_evaluation(board)
         material_points *= MATERIAL_POINTS_WEIGHT
 
         # Mobility Evaluation
-        # mobility = len(list(board.legal_moves)) * MOBILITY_WEIGHT
+        # mobility = board.legal_moves.count() * MOBILITY_WEIGHT
         # if not board.turn:
         #     mobility *= -1
 
-        # Center Control Evaluation
-        central_control = 0
-
-        central_control += len(board.attackers(chess.WHITE, chess.D4))
-        central_control += len(board.attackers(chess.WHITE, chess.D5))
-        central_control += len(board.attackers(chess.WHITE, chess.E4))
-        central_control += len(board.attackers(chess.WHITE, chess.E5))
-
-        central_control -= len(board.attackers(chess.BLACK, chess.D4))
-        central_control -= len(board.attackers(chess.BLACK, chess.D5))
-        central_control -= len(board.attackers(chess.BLACK, chess.E4))
-        central_control -= len(board.attackers(chess.BLACK, chess.E5))
-
-        central_control *= CENTRAL_CONTROL_WEIGHT
-
-        # Outer Center Control Evaluation
-        outer_center_control = 0
-
-        outer_center_control += len(board.attackers(chess.WHITE, chess.C6))
-        outer_center_control += len(board.attackers(chess.WHITE, chess.D6))
-        outer_center_control += len(board.attackers(chess.WHITE, chess.E6))
-        outer_center_control += len(board.attackers(chess.WHITE, chess.F6))
-        outer_center_control += len(board.attackers(chess.WHITE, chess.C5))
-        outer_center_control += len(board.attackers(chess.WHITE, chess.F5))
-        outer_center_control += len(board.attackers(chess.WHITE, chess.C4))
-        outer_center_control += len(board.attackers(chess.WHITE, chess.F4))
-        # outer_center_control += len(board.attackers(chess.WHITE, chess.C3))
-        # outer_center_control += len(board.attackers(chess.WHITE, chess.D3))
-        # outer_center_control += len(board.attackers(chess.WHITE, chess.E3))
-        # outer_center_control += len(board.attackers(chess.WHITE, chess.F3))
-
-        # outer_center_control -= len(board.attackers(chess.BLACK, chess.C6))
-        # outer_center_control -= len(board.attackers(chess.BLACK, chess.D6))
-        # outer_center_control -= len(board.attackers(chess.BLACK, chess.E6))
-        # outer_center_control -= len(board.attackers(chess.BLACK, chess.F6))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.C5))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.F5))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.C4))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.F4))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.C3))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.D3))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.E3))
-        outer_center_control -= len(board.attackers(chess.BLACK, chess.F3))
-
-        outer_center_control *= OUTER_CENTRAL_CONTROL_WEIGHT
+        # Center and Outer Center Control Evaluation
+        white_center, white_outer_center = self._count_attackers(
+            board, chess.WHITE, ChessEngine.CENTER_MASK, ChessEngine.WHITE_OUTER_CENTER_MASK
+        )
+        black_center, black_outer_center = self._count_attackers(
+            board, chess.BLACK, ChessEngine.CENTER_MASK, ChessEngine.BLACK_OUTER_CENTER_MASK
+        )
+        central_control = (white_center - black_center) * CENTRAL_CONTROL_WEIGHT
+        outer_center_control = (white_outer_center - black_outer_center) * OUTER_CENTRAL_CONTROL_WEIGHT
 
         # Development Evaluation
         development = 0
-        white_row = board_rows[7]
-        black_row = board_rows[0]
-        black_pieces_hiding = len([x for x in black_row if x in ["n", "b"]])
-        white_pieces_hiding = len([x for x in white_row if x in ["N", "B"]])
+        minor_pieces = board.knights | board.bishops
+        black_pieces_hiding = chess.popcount(minor_pieces & board.occupied_co[chess.BLACK] & chess.BB_RANK_8)
+        white_pieces_hiding = chess.popcount(minor_pieces & board.occupied_co[chess.WHITE] & chess.BB_RANK_1)
         development = black_pieces_hiding - white_pieces_hiding
         development *= DEVELOPMENT_WEIGHT
 
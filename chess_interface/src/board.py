@@ -12,6 +12,8 @@ from chess_interface.src.sound import Sound
 class Board:
     def __init__(self) -> None:
         self.squares: Square = [[None] * ROWS for col in range(COLS)]
+        # Pieces by row * COLS + col, apart from the squares' fixed geometry
+        self.pieces: List[Piece] = [None] * (ROWS * COLS)
         self.last_move: Move = None
         self.chess_game: ChessGame = ChessGame()
         self._create_squares()
@@ -52,6 +54,18 @@ class Board:
         ]
         return valid_end_pos
 
+    def piece_at(self, row: int, col: int) -> Piece:
+        """
+        Returns the piece in the given square, or None.
+        """
+        return self.pieces[row * COLS + col]
+
+    def has_piece(self, row: int, col: int) -> bool:
+        """
+        Checks if there is a piece in the given square.
+        """
+        return self.pieces[row * COLS + col] is not None
+
     def _create_squares(self) -> None:
         """
         Initial squares constructor.
@@ -62,13 +76,12 @@ class Board:
 
     def _update_pieces(self) -> None:
         """
-        Updates pieces in each of our board's squares
-        according to the board_matrix returned from chess_game.
+        Updates the pieces' list in place according to the
+        piece_map returned from chess_game. The list is
+        blanked first, as the map only holds occupied squares.
         """
-        board_matrix = self.chess_game.board_matrix()
-        for row in range(ROWS):
-            for col in range(COLS):
-                symbol = board_matrix[row][col]
-                piece = PIECE_MAPPING[symbol][0]
-                color = PIECE_MAPPING[symbol][1]
-                self.squares[row][col] = Square(row, col, piece(color) if piece else piece)
+        self.pieces[:] = [None] * (ROWS * COLS)
+        for square, chess_piece in self.chess_game.piece_map().items():
+            piece, color = PIECE_MAPPING[chess_piece.symbol()]
+            # Squares are numbered from a1, while rows start at the 8th rank
+            self.pieces[chess.square_mirror(square)] = piece(color)
@@ -20,12 +20,16 @@ class Dragger:
         Updates dragged piece image according
         to the current mouse position.
         """
-        self.piece.set_texture(size=128)
-        texture = self.piece.texture
-        img = pygame.image.load(texture)
+        self.piece.texture_rect = self.get_rect()
+        surface.blit(self.piece.texture_surface, self.piece.texture_rect)
+
+    def get_rect(self) -> pygame.Rect:
+        """
+        Returns the area covered by the dragged
+        piece image at the current mouse position.
+        """
         img_center = (self.mouseX, self.mouseY)
-        self.piece.texture_rect = img.get_rect(center=img_center)
-        surface.blit(img, self.piece.texture_rect)
+        return self.piece.texture_surface.get_rect(center=img_center)
 
     def update_mouse(self, pos: Tuple[int, int]) -> None:
         self.mouseX, self.mouseY = pos
@@ -48,14 +52,19 @@ class Dragger:
     def drag_piece(self, piece: Piece) -> None:
         """
         Save the state of the chosen piece as dragging.
+        The piece is drawn bigger while it's dragged.
         """
+        piece.set_texture(size=128)
         self.piece = piece
         self.dragging = True
 
     def undrag_piece(self) -> None:
         """
         Reset the state of the chosen piece and the stored valid moves.
+        The piece gets its board texture back, in case it isn't moved.
         """
+        if self.piece:
+            self.piece.set_texture(size=80)
         self.piece = None
         self.dragging = False
         self.valid_moves = []
@@ -1,5 +1,7 @@
 import pygame
 
+from typing import List
+
 from chess_game.chess_game import ChessGame
 
 from chess_interface.src.const import *
@@ -18,11 +20,54 @@ class Interface:
         self.dragger = Dragger()
         self.config = Config()
         self.theme = self.config.theme
+        self._load_textures()
+        self._render_theme_surfaces()
+        # What was drawn by the last frame, see 'get_dirty_rects'
+        self._drawn_state = None
+        self._drawn_hover_rect = None
+        self._drawn_drag_rect = None
+
+    def _load_textures(self) -> None:
+        """
+        Loads every piece's image once, so the
+        first frames don't read them from disk.
+        """
+        for piece, color in PIECE_MAPPING.values():
+            if piece:
+                piece(color).texture_surface
+
+    def _render_theme_surfaces(self) -> None:
+        """
+        Pre-renders the surfaces that only change with the
+        theme: the board's background, the promotion dialog and
+        the tiles of the moves and last move highlights.
+        """
+        self._bg_surface = pygame.Surface((WIDTH, HEIGHT)).convert()
+        self._render_bg(self._bg_surface)
+        self._promotion_surface = pygame.Surface((WIDTH, HEIGHT), pygame.SRCALPHA).convert_alpha()
+        self._render_promotion_dialog(self._promotion_surface)
+        # Tiles indexed by (row + col) % 2: light squares first
+        self._moves_tiles = (self._render_tile(self.theme.moves.light), self._render_tile(self.theme.moves.dark))
+        self._trace_tiles = (self._render_tile(self.theme.trace.light), self._render_tile(self.theme.trace.dark))
+
+    def _render_tile(self, color) -> pygame.Surface:
+        """
+        Returns a square filled with the given color.
+        """
+        tile = pygame.Surface((SQSIZE, SQSIZE)).convert()
+        tile.fill(color)
+        return tile
 
     def show_bg(self, surface: pygame.Surface) -> None:
         """
         Display board's squares and labels
         """
+        surface.blit(self._bg_surface, (0, 0))
+
+    def _render_bg(self, surface: pygame.Surface) -> None:
+        """
+        Draws board's squares and labels
+        """
         for row in range(ROWS):
             for col in range(COLS):
                 color = self.theme.bg.light if (row + col) % 2 == 0 else self.theme.bg.dark
@@ -45,30 +90,29 @@ class Interface:
         """
         Display every piece not being dragged.
         """
-        for row in range(ROWS):
-            for col in range(COLS):
-                if self.board.squares[row][col].has_piece():
-                    piece = self.board.squares[row][col].piece
-                    # Display all pieces except piece being dragged
-                    if piece is not self.dragger.piece:
-                        piece.set_texture(size=80)
-                        img = pygame.image.load(piece.texture)
-                        img_center = (
-                            col * SQSIZE + SQSIZE // 2,
-                            row * SQSIZE + SQSIZE // 2,
-                        )
-                        piece.texture_rect = img.get_rect(center=img_center)
-                        surface.blit(img, piece.texture_rect)
+        dragged = self.dragger.piece
+        blit_sequence = []
+        for index, piece in enumerate(self.board.pieces):
+            # Display all pieces except piece being dragged
+            if piece is not None and piece is not dragged:
+                row, col = divmod(index, COLS)
+                img = piece.texture_surface
+                width, height = img.get_size()
+                # Top-left corner that centers the image on its square
+                pos = (col * SQSIZE + (SQSIZE - width) // 2, row * SQSIZE + (SQSIZE - height) // 2)
+                blit_sequence.append((img, pos))
+        surface.blits(blit_sequence, doreturn=False)
 
     def show_moves(self, surface: pygame.Surface) -> None:
         """
         Display all possible (valid) moves when dragging a piece.
         """
         if self.dragger.dragging:
-            for move in self.dragger.valid_moves:
-                color = self.theme.moves.light if (move[0] + move[1]) % 2 == 0 else self.theme.moves.dark
-                rect = (move[1] * SQSIZE, move[0] * SQSIZE, SQSIZE, SQSIZE)
-                pygame.draw.rect(surface, color, rect)
+            tiles = self._moves_tiles
+            surface.blits(
+                [(tiles[(row + col) % 2], (col * SQSIZE, row * SQSIZE)) for row, col in self.dragger.valid_moves],
+                doreturn=False,
+            )
 
     def show_last_move(self, surface: pygame.Surface) -> None:
         """
@@ -79,10 +123,11 @@ class Interface:
             initial = self.board.last_move.initial
             final = self.board.last_move.final
 
-            for pos in [initial, final]:
-                color = self.theme.trace.light if (pos.row + pos.col) % 2 == 0 else self.theme.trace.dark
-                rect = (pos.col * SQSIZE, pos.row * SQSIZE, SQSIZE, SQSIZE)
-                pygame.draw.rect(surface, color, rect)
+            tiles = self._trace_tiles
+            surface.blits(
+                [(tiles[(pos.row + pos.col) % 2], (pos.col * SQSIZE, pos.row * SQSIZE)) for pos in [initial, final]],
+                doreturn=False,
+            )
 
     def show_hover(self, surface: pygame.Surface) -> None:
         """
@@ -104,10 +149,16 @@ class Interface:
         Displays promotion dialog, containing possible
         pieces and respective numbers to press.
         """
-        transparency = pygame.Surface((WIDTH, HEIGHT))
-        transparency.set_alpha(192)
-        transparency.fill(self.theme.bg.dark)
-        surface.blit(transparency, (0, 0))
+        surface.blit(self._promotion_surface, (0, 0))
+
+    def _render_promotion_dialog(self, surface: pygame.Surface) -> None:
+        """
+        Draws promotion dialog on a transparent surface: a
+        translucent layer, the pieces and their numbers.
+        """
+        transparency = pygame.Color(self.theme.bg.dark)
+        transparency.a = 192
+        surface.fill(transparency)
 
         message = "Choose the piece you want to promote to!"
         text = self.config.font_big.render(message, 1, "black", "white")
@@ -121,8 +172,7 @@ class Interface:
             (Bishop("white"), 4),
         ]:
             # Draw piece
-            texture = piece.texture
-            img = pygame.image.load(texture)
+            img = piece.texture_surface
             img_center = ((num + 1.5) * SQSIZE, 4 * SQSIZE)
             piece.texture_rect = img.get_rect(center=img_center)
             surface.blit(img, piece.texture_rect)
@@ -142,6 +192,33 @@ class Interface:
         self.show_pieces(surface)
         self.show_hover(surface)
 
+    def get_dirty_rects(self, promotion_time: bool) -> List[pygame.Rect]:
+        """
+        Returns the regions of the screen that changed since the
+        last call, to be redrawn. A new position, last move, theme,
+        dragged piece or promotion dialog changes the whole screen,
+        while the hover and the dragged piece's motion only change
+        the areas they leave and reach. Returns [] if nothing changed.
+        """
+        state = (self.board.chess_game.hash, self.board.last_move, self.theme, self.dragger.piece, promotion_time)
+        hover_rect = None
+        if self.hovered_sqr:
+            hover_rect = pygame.Rect(self.hovered_sqr.col * SQSIZE, self.hovered_sqr.row * SQSIZE, SQSIZE, SQSIZE)
+        drag_rect = self.dragger.get_rect() if self.dragger.dragging else None
+
+        if state != self._drawn_state:
+            dirty_rects = [pygame.Rect(0, 0, WIDTH, HEIGHT)]
+        else:
+            dirty_rects = []
+            if hover_rect != self._drawn_hover_rect:
+                dirty_rects += [rect for rect in (self._drawn_hover_rect, hover_rect) if rect]
+            if drag_rect != self._drawn_drag_rect:
+                dirty_rects += [rect for rect in (self._drawn_drag_rect, drag_rect) if rect]
+        self._drawn_state = state
+        self._drawn_hover_rect = hover_rect
+        self._drawn_drag_rect = drag_rect
+        return dirty_rects
+
     def next_turn(self) -> None:
         """
         Sets the 'next_player' attribute to the other player.
@@ -161,6 +238,7 @@ class Interface:
         """
         self.config.change_theme()
         self.theme = self.config.theme
+        self._render_theme_surfaces()
 
     def play_sound(self, captured=False) -> None:
         """
@@ -173,4 +251,12 @@ class Interface:
             self.config.move_sound.play()
 
     def reset(self) -> None:
-        self.__init__()
+        """
+        Starts a new game. The config (and so the theme)
+        and the pre-rendered surfaces are kept.
+        """
+        self.next_player = "white"
+        self.hovered_sqr = None
+        self.board = Board()
+        self.dragger = Dragger()
+        self._drawn_state = None
@@ -9,17 +9,22 @@ from chess_interface.src.move import Move
 
 PVP_ON = False
 DEPTH = 5
+# Frame rate cap of the main loop
+FPS = 60
+# Longest wait for an event while the board is idle, in ms
+IDLE_WAIT = 100
 
 
 class Main:
     def __init__(self) -> None:
         pygame.init()
-        self.screen = pygame.display.set_mode((WIDTH, HEIGHT))
+        self.screen = pygame.display.set_mode((WIDTH, HEIGHT), pygame.DOUBLEBUF)
         caption = "CT-213 Guaxinim-Chess "
         caption += "(Human x Human)" if PVP_ON else "(Human x AI)"
         pygame.display.set_caption("CT-213 Guaxinim Chess (Human x AI)")
         self.interface = Interface()
         self.engine = ChessEngine(depth=DEPTH, algorithm="pvs")
+        self.clock = pygame.time.Clock()
 
     def mainloop(self):
         """
@@ -33,14 +38,39 @@ class Main:
         promotion_time = False
 
         while True:
-            # Draw stuff on screen
-            interface.show_all(screen)
-            if promotion_time:
-                interface.show_promotion_dialog(screen)
-            if dragger.dragging:
-                dragger.update_blit(screen)
-            # Handle events
-            for event in pygame.event.get():
+            # Draw stuff on screen, clipped to the regions that changed
+            dirty_rects = interface.get_dirty_rects(promotion_time)
+            if dirty_rects:
+                screen.set_clip(dirty_rects[0].unionall(dirty_rects[1:]))
+                interface.show_all(screen)
+                if promotion_time:
+                    interface.show_promotion_dialog(screen)
+                if dragger.dragging:
+                    dragger.update_blit(screen)
+                screen.set_clip(None)
+                pygame.display.update(dirty_rects)
+
+            # AI Behavior, once per turn and after its board has been shown
+            if interface.next_player == "black" and not PVP_ON:
+                best_move = self.engine.best_move(board.chess_game)
+                initial = Square.position_to_row_col(str(best_move)[0:2])
+                final = Square.position_to_row_col(str(best_move)[2:4])
+
+                AI_move = Move(board.squares[initial[0]][initial[1]], board.squares[final[0]][final[1]])
+
+                is_capture = board.has_piece(final[0], final[1])
+                board.last_move = AI_move
+                board.move(AI_move)
+                interface.play_sound(is_capture)
+                interface.next_turn()
+
+            # Handle events. While the board is idle (a player's turn,
+            # with no drag or promotion going on), sleep until one comes
+            if (interface.next_player == "white" or PVP_ON) and not dragger.dragging and not promotion_time:
+                events = [pygame.event.wait(IDLE_WAIT)] + pygame.event.get()
+            else:
+                events = pygame.event.get()
+            for event in events:
                 # Player behavior
                 if interface.next_player == "white" or PVP_ON:
                     if not promotion_time:
@@ -52,8 +82,8 @@ class Main:
                             clicked_col = dragger.mouseX // SQSIZE
 
                             # If clicked square has a piece
-                            if board.squares[clicked_row][clicked_col].has_piece():
-                                piece = board.squares[clicked_row][clicked_col].piece
+                            if board.has_piece(clicked_row, clicked_col):
+                                piece = board.piece_at(clicked_row, clicked_col)
                                 # If piece is from the current player
                                 if piece.color == interface.next_player:
                                     dragger.save_initial(event.pos)
@@ -76,9 +106,9 @@ class Main:
                                 released_row = dragger.mouseY // SQSIZE
                                 released_col = dragger.mouseX // SQSIZE
 
-                                # Create possible move
-                                initial = Square(dragger.initial_row, dragger.initial_col)
-                                final = Square(released_row, released_col)
+                                # Create possible move, from the board's own squares
+                                initial = board.squares[dragger.initial_row][dragger.initial_col]
+                                final = board.squares[released_row][released_col]
                                 move = Move(initial, final)
 
                                 # If the move created is a valid one
@@ -86,28 +116,13 @@ class Main:
                                     if board.is_promotion_move(move):
                                         promotion_time = True
                                     if board.is_valid_move(move):
-                                        is_capture = board.squares[released_row][released_col].has_piece()
+                                        is_capture = board.has_piece(released_row, released_col)
                                         board.last_move = move
                                         board.move(move)
                                         interface.play_sound(is_capture)
                                         interface.next_turn()
 
                             dragger.undrag_piece()
-                # AI Behavior
-                else:
-                    best_move = self.engine.best_move(board.chess_game)
-                    initial = Square.position_to_row_col(str(best_move)[0:2])
-                    final = Square.position_to_row_col(str(best_move)[2:4])
-
-                    AI_initial = Square(initial[0], initial[1])
-                    AI_final = Square(final[0], final[1])
-                    AI_move = Move(AI_initial, AI_final)
-
-                    is_capture = board.squares[final[0]][final[1]].has_piece()
-                    board.last_move = AI_move
-                    board.move(AI_move)
-                    interface.play_sound(is_capture)
-                    interface.next_turn()
 
                 # Key press events
                 if event.type == pygame.KEYDOWN:
@@ -128,7 +143,7 @@ class Main:
                             chosen = "b"
                         if chosen:
                             promotion_time = False
-                            is_capture = board.squares[released_row][released_col].has_piece()
+                            is_capture = board.has_piece(released_row, released_col)
                             board.last_move = move
                             board.move(move, promotion=chosen)
                             interface.play_sound(is_capture)
@@ -152,7 +167,8 @@ class Main:
                     pygame.quit()
                     sys.exit()
 
-            pygame.display.update()
+            # Sleep for the rest of the frame instead of spinning
+            self.clock.tick(FPS)
 
 
 main = Main()
@@ -2,6 +2,8 @@ from chess_interface.src.square import Square
 
 
 class Move:
+    __slots__ = ("initial", "final")
+
     def __init__(self, initial: Square, final: Square) -> None:
         """
         A move is defined by a initial square and final
@@ -20,6 +22,9 @@ class Move:
     def __eq__(self, other) -> bool:
         return self.initial == other.initial and self.final == other.final
 
+    def __hash__(self) -> int:
+        return hash(self.initial) * 64 + hash(self.final)
+
     def uci_code(self) -> str:
         """
         Concatenates the two positions (initial and final)
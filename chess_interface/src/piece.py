@@ -1,4 +1,15 @@
 import os
+import pygame
+
+# Texture paths of the pieces by (color, name, size), and their
+# images, loaded once by texture path
+_TEXTURE_PATHS = {
+    (color, name, size): os.path.join(f"chess_interface/assets/images/imgs-{size}px/{color}_{name}.png")
+    for color in ("white", "black")
+    for name in ("pawn", "knight", "bishop", "rook", "queen", "king")
+    for size in (80, 128)
+}
+_TEXTURE_CACHE = {}  # Dict[str, pygame.Surface]
 
 
 class Piece:
@@ -10,7 +21,20 @@ class Piece:
         self.texture_rect = texture_rect
 
     def set_texture(self, size=80):
-        self.texture = os.path.join(f"chess_interface/assets/images/imgs-{size}px/{self.color}_{self.name}.png")
+        self.texture = _TEXTURE_PATHS[(self.color, self.name, size)]
+
+    @property
+    def texture_surface(self) -> pygame.Surface:
+        """
+        Image of the current texture. It's only loaded from
+        disk (and converted to the display's pixel format)
+        the first time, then it's shared by all the pieces.
+        """
+        surface = _TEXTURE_CACHE.get(self.texture)
+        if surface is None:
+            surface = pygame.image.load(self.texture).convert_alpha()
+            _TEXTURE_CACHE[self.texture] = surface
+        return surface
 
 
 class Pawn(Piece):
@@ -1,34 +1,27 @@
 from typing import Tuple
 
+# Positions ("a8", ..., "h1") by row and col, and the other way around
+_POSITIONS = [["abcdefgh"[col] + str(8 - row) for col in range(8)] for row in range(8)]
+_ROW_COLS = {_POSITIONS[row][col]: (row, col) for row in range(8) for col in range(8)}
+
 
 class Square:
     ALPHACOLS = {0: "a", 1: "b", 2: "c", 3: "d", 4: "e", 5: "f", 6: "g", 7: "h"}
     ALPHACOLS_INVERSE = {"a": 0, "b": 1, "c": 2, "d": 3, "e": 4, "f": 5, "g": 6, "h": 7}
 
-    def __init__(self, row: int, col: int, piece=None):
+    __slots__ = ("row", "col", "alphacol", "position")
+
+    def __init__(self, row: int, col: int):
         self.row = row
         self.col = col
-        self.piece = piece
         self.alphacol = Square.ALPHACOLS[col]
         self.position = Square.row_col_to_position(row, col)
 
     def __eq__(self, other) -> bool:
         return self.row == other.row and self.col == other.col
 
-    def has_piece(self) -> bool:
-        return self.piece != None
-
-    # def isempty(self) -> bool:
-    #     return not self.has_piece()
-
-    # def has_team_piece(self, color) -> bool:
-    #     return self.has_piece() and self.piece.color == color
-
-    # def has_enemy_piece(self, color) -> bool:
-    #     return self.has_piece() and self.piece.color != color
-
-    # def isempty_or_enemy(self, color) -> bool:
-    #     return self.isempty() or self.has_enemy_piece(color)
+    def __hash__(self) -> int:
+        return self.row * 8 + self.col
 
     @staticmethod
     def in_range(*args):
@@ -39,17 +32,12 @@ class Square:
 
     @staticmethod
     def get_alphacol(col):
-        ALPHACOLS = {0: "a", 1: "b", 2: "c", 3: "d", 4: "e", 5: "f", 6: "g", 7: "h"}
-        return ALPHACOLS[col]
+        return Square.ALPHACOLS[col]
 
     @staticmethod
     def row_col_to_position(row, col) -> str:
-        position = Square.ALPHACOLS[col] + str(8 - row)
-        return position
+        return _POSITIONS[row][col]
 
     @staticmethod
     def position_to_row_col(position) -> Tuple[int, int]:
-        col_alpha = position[0]
-        col = Square.ALPHACOLS_INVERSE[col_alpha]
-        row = 8 - int(position[1])
-        return row, col
+        return _ROW_COLS[position]
@@ -28,8 +28,10 @@ def evaluate_category(category: str, depth: int, algorithm: Literal["minimax", "
 #     evaluate_category("middlegame", 3, algorithm=algorithm, limit=20)
 #     evaluate_category("middlegame", 4, algorithm=algorithm, limit=20)
 
-for algorithm in ["abpi"]:
-    evaluate_category("endgame", 1, algorithm=algorithm, limit=20)
-    evaluate_category("endgame", 2, algorithm=algorithm, limit=20)
-    evaluate_category("endgame", 3, algorithm=algorithm, limit=20)
-    evaluate_category("endgame", 4, algorithm=algorithm, limit=20)
+# Worker processes of the evaluation may import this script, which must not rerun it
+if __name__ == "__main__":
+    for algorithm in ["abpi"]:
+        evaluate_category("endgame", 1, algorithm=algorithm, limit=20)
+        evaluate_category("endgame", 2, algorithm=algorithm, limit=20)
+        evaluate_category("endgame", 3, algorithm=algorithm, limit=20)
+        evaluate_category("endgame", 4, algorithm=algorithm, limit=20)
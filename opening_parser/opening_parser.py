@@ -32,17 +32,18 @@ with open("opening_parser/Guaxinim Chess Openings - FinalTable.csv") as opening_
         num_moves = len(moves)
         chess_game = ChessGame()
         for move in moves:
-            # probability = opening_probabilities.get(chess_game.hash_game(), 0)
-            board_num_moves = opening_length.get(chess_game.hash_game(), 0)
+            key = chess_game.opening_key()
+            # probability = opening_probabilities.get(key, 0)
+            board_num_moves = opening_length.get(key, 0)
             # current_probability = black_probability
             # if chess_game.white_to_play():
             #     current_probability = white_probability
 
             # if current_probability > probability:
             if num_moves > board_num_moves:
-                # opening_probabilities[chess_game.hash_game()] = white_probability
-                opening_length[chess_game.hash_game()] = num_moves
-                opening_sheet[chess_game.hash_game()] = str(chess_game.parse_san(move))
+                # opening_probabilities[key] = white_probability
+                opening_length[key] = num_moves
+                opening_sheet[key] = str(chess_game.parse_san(move))
 
             chess_game.play_by_san(move)
 
@@ -1,5 +1,7 @@
 from typing import Literal, Tuple
-from time import time
+from time import perf_counter
+from multiprocessing import Pool
+import itertools
 
 from chess_game.chess_game import ChessEngine, ChessGameByFen
 from puzzle.puzzle_parser.puzzle_parser import Puzzle
@@ -19,50 +21,70 @@ def engine_solves_puzzle(puzzle: Puzzle, engine: ChessEngine) -> Tuple[bool, flo
     solves a single puzzle.
     """
     game = ChessGameByFen(puzzle.fen)
-    moves = puzzle.moves
-    num_moves = len(moves)
-    assert num_moves % 2 == 0
-    num_moves = num_moves // 2
-    total_time = 0
-    for i in range(num_moves):
-        game.play(moves[2 * i])
-        start = time()
+    num_moves = 0
+    # The searches take nearly all the time, so the whole loop is timed
+    start = perf_counter()
+    for played_move, expected_move in puzzle.iter_move_pairs():
+        game.play(played_move)
         predicted_move = engine.best_move(game)
-        total_time += time() - start
-        if predicted_move != moves[2 * i + 1]:
-            return False, total_time / (i + 1)
+        num_moves += 1
+        if predicted_move != expected_move:
+            return False, (perf_counter() - start) / num_moves
         game.play(predicted_move)
-    return True, total_time / num_moves
+    return True, (perf_counter() - start) / num_moves
+
+
+# Engine of a worker process of the evaluation, shared by all its puzzles
+_worker_engine: ChessEngine = None
+
+
+def _init_worker(depth: int, algorithm: str) -> None:
+    """
+    Creates the engine of a worker process of the pool.
+    """
+    global _worker_engine
+    _worker_engine = ChessEngine(depth=depth, algorithm=algorithm)
+
+
+def _solve_puzzle_line(line: str) -> Tuple[str, bool, float]:
+    """
+    Evaluates the puzzle of a line of a category file
+    with the engine of the worker process running it.
+    """
+    puzzle = Puzzle(line)
+    success, average_time_per_move = engine_solves_puzzle(puzzle, _worker_engine)
+    return puzzle.puzzle_id, success, average_time_per_move
 
 
 def evaluate_engine_by_category(
-    category: str, depth: int, algorithm: Literal["minimax", "abp", "abpi"] = "abpi", limit=None
+    category: str, depth: int, algorithm: Literal["minimax", "abp", "abpi"] = "abpi", limit=None, processes=None
 ) -> Tuple[float, float]:
     """
     Evaluates an engine (defined by its 'algorithm' and 'depth')
-    using n = 'limit' puzzles from the given 'category'.
+    using n = 'limit' puzzles from the given 'category'. The
+    puzzles are independent, so they are split between
+    'processes' workers (by default, one per CPU core).
     """
     file_name = "puzzle/puzzles/category_separated/" + category + ".csv"
     report_file_name = "puzzle/puzzles/category_reports/" + category + ".csv"
     total_count = 0
     correct_count = 0
     total_time = 0
+    failed_puzzle_ids = []
     with open(file_name, "r") as f:
-        for line in f:
-            chess_engine = ChessEngine(depth=depth, algorithm=algorithm)
-            puzzle = Puzzle(line)
-
-            success, average_time_per_move = engine_solves_puzzle(puzzle, chess_engine)
+        lines = list(itertools.islice(f, limit or None))
+    with Pool(processes, initializer=_init_worker, initargs=(depth, algorithm)) as pool:
+        # Searches take long, so puzzles are handed out one at a time
+        for puzzle_id, success, average_time_per_move in pool.imap(_solve_puzzle_line, lines):
             if success:
                 correct_count += 1
             else:
-                with open(report_file_name, "a") as rf:
-                    rf.write(f"{puzzle.puzzle_id}\n")
+                failed_puzzle_ids.append(puzzle_id)
             total_time += average_time_per_move
             total_count += 1
-            if limit:
-                if total_count >= limit:
-                    break
+    if failed_puzzle_ids:
+        with open(report_file_name, "a") as rf:
+            rf.write("".join(f"{puzzle_id}\n" for puzzle_id in failed_puzzle_ids))
     score = correct_count / total_count
     average_time_per_move = total_time / total_count
     return score, average_time_per_move
@@ -1,34 +1,73 @@
-from typing import List
+from typing import Iterator, List, Tuple
 from chess import Move
 
 
 class Puzzle:
+    __slots__ = ("puzzle_string", "puzzle_id", "fen", "themes", "game_url", "opening_tags", "_fields", "_moves")
+
     def __init__(self, puzzle_string: str) -> None:
         self.puzzle_string: str = puzzle_string
         self.puzzle_id: str = None
         self.fen: str = None
-        self.moves: List[Move] = None
-        self.num_moves: int = None
-        self.rating: int = None
-        self.rating_deviation: int = None
-        self.popularity: int = None
-        self.nb_plays: int = None
         self.themes: List[str] = None
         self.game_url: str = None
         self.opening_tags: List[str] = None
+        # Fields of the puzzle string. The moves and the numeric
+        # fields are only parsed from them when they are used
+        self._fields: List[str] = None
+        self._moves: List[Move] = None
         self.parse_puzzle(puzzle_string)
 
     def parse_puzzle(self, puzzle_string: str) -> None:
         fields = puzzle_string.split(",")
+        self._fields = fields
+        self._moves = None
         self.puzzle_id = fields[0]
         self.fen = fields[1]
-        moves_strings = fields[2].split(" ")
-        self.moves = [Move.from_uci(move_string) for move_string in moves_strings]
-        self.num_moves = len(self.moves) // 2
-        self.rating = int(fields[3])
-        self.rating_deviation = int(fields[4])
-        self.popularity = int(fields[5])
-        self.nb_plays = int(fields[6])
         self.themes = fields[7].split(" ")
         self.game_url = fields[8]
         self.opening_tags = fields[9].split(" ")
+
+    @property
+    def moves(self) -> List[Move]:
+        if self._moves is None:
+            self._moves = [Move.from_uci(move_string) for move_string in self._fields[2].split(" ")]
+        return self._moves
+
+    @staticmethod
+    def parse_themes(puzzle_string: str) -> List[str]:
+        """
+        Parses only the themes of a puzzle string.
+        """
+        return puzzle_string.split(",", 8)[7].split(" ")
+
+    def iter_move_pairs(self) -> Iterator[Tuple[Move, Move]]:
+        """
+        Yields the moves in pairs (opponent's move, expected answer),
+        each one parsed only when it's reached.
+        """
+        move_strings = self._fields[2].split(" ")
+        assert len(move_strings) % 2 == 0
+        move_strings = iter(move_strings)
+        for played_move_string, answer_move_string in zip(move_strings, move_strings):
+            yield Move.from_uci(played_move_string), Move.from_uci(answer_move_string)
+
+    @property
+    def num_moves(self) -> int:
+        return len(self._fields[2].split(" ")) // 2
+
+    @property
+    def rating(self) -> int:
+        return int(self._fields[3])
+
+    @property
+    def rating_deviation(self) -> int:
+        return int(self._fields[4])
+
+    @property
+    def popularity(self) -> int:
+        return int(self._fields[5])
+
+    @property
+    def nb_plays(self) -> int:
+        return int(self._fields[6])
@@ -1,32 +1,63 @@
+import os
+from typing import IO, Iterator, List, Tuple
+
 from puzzle.puzzle_parser.puzzle_parser import Puzzle
 from puzzle.puzzle_themes import THEMES
 
 PUZZLE_FOLDER = "puzzle/puzzles/"
 FILE_NAME = "lichess_db_puzzle_small.csv"
+# Sample the puzzles even if the category files are up to date
+FORCE_SAMPLING = False
+
+
+def category_file_name(theme: str) -> str:
+    return PUZZLE_FOLDER + f"category_separated/{theme}.csv"
+
+
+def category_files_are_up_to_date() -> bool:
+    """
+    Checks if every category file was written after
+    the last change of the puzzle database.
+    """
+    database_time = os.path.getmtime(PUZZLE_FOLDER + FILE_NAME)
+    for theme in THEMES:
+        file_name = category_file_name(theme)
+        if not os.path.exists(file_name) or os.path.getmtime(file_name) < database_time:
+            return False
+    return True
+
+
+def read_puzzles(input_file: IO[str]) -> Iterator[Tuple[str, List[str]]]:
+    """
+    Yields each puzzle string of the database, skipping its header,
+    with its themes. Only the themes are parsed, as the sampling
+    doesn't need the other fields of a Puzzle.
+    """
+    next(input_file)
+    for line in input_file:
+        yield line, Puzzle.parse_themes(line)
 
 
-def action(puzzle: Puzzle) -> None:
-    for theme in puzzle.themes:
-        if theme in THEMES:
-            with open(PUZZLE_FOLDER + f"category_separated/{theme}.csv", "a") as f:
-                f.write(puzzle.puzzle_string)
+def action(puzzle_string: str, themes: List[str]) -> None:
+    for theme in themes:
+        category_file = category_files.get(theme)
+        if category_file is not None:
+            category_file.write(puzzle_string)
 
 
 def final_action() -> None:
-    pass
+    for category_file in category_files.values():
+        category_file.close()
 
 
-for theme in THEMES:
-    with open(PUZZLE_FOLDER + f"category_separated/{theme}.csv", "w") as f:
-        f.write("")
+if not FORCE_SAMPLING and category_files_are_up_to_date():
+    print("\nCategory files are already up to date!")
+else:
+    # Category files by theme, emptied and kept open while sampling
+    category_files = {theme: open(category_file_name(theme), "w", buffering=1 << 20) for theme in THEMES}
 
-with open(PUZZLE_FOLDER + FILE_NAME, "r") as input_file:
-    count = 0
-    for line in input_file:
-        count += 1
-        if count == 1:
-            continue
-        puzzle = Puzzle(line)
-        action(puzzle)
-    final_action()
-    print("\nFinished!")
+    with open(PUZZLE_FOLDER + FILE_NAME, "r") as input_file:
+        for puzzle_string, themes in read_puzzles(input_file):
+            action(puzzle_string, themes)
+        final_action()
+        print("\nFinished!")